@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from functools import partial, wraps
 from typing import Any, Callable, Generic, Self, TypeVar, cast, overload
+from weakref import WeakKeyDictionary
 
 from .exc import StandbyError, VariableNotSet
 
@@ -13,7 +14,37 @@ S = TypeVar("S")
 T = TypeVar("T")
 
 
+class _Missing:
+    __slots__ = ()
+
+
+# Sentinel returned by Variable._try instead of raising VariableNotSet;
+# probing with it skips exception construction on backup-chain misses.
+_MISSING = _Missing()
+
+# Values computed via descriptor access (Conf.X) memoized per owner class;
+# entries are dropped when the owner is garbage-collected and invalidated
+# whenever the cache generation is bumped by env.reset_cache().
+_descriptor_cache: WeakKeyDictionary[type, dict[Variable[Any], tuple[int, Any]]] = WeakKeyDictionary()
+_cache_generation = 0
+
+
+def _bump_cache_generation() -> None:
+    global _cache_generation
+    _cache_generation += 1
+    _descriptor_cache.clear()
+
+
+# Factories memoized per (class, args, kwargs): repeated Variable.factory calls
+# with the same arguments reuse one partial instead of allocating a new closure.
+_factory_cache: dict[tuple[Any, ...], Callable[..., Any]] = {}
+
+
 class Variable(Generic[T], ABC):
+    # Concrete subclasses stay without __slots__: dataclass(slots=True) on a frozen
+    # Generic breaks subscripted instantiation like Var[int](...) on Python 3.11.
+    __slots__ = ()
+
     @abstractmethod
     def value(self) -> T:  # pragma: no cover
         raise NotImplementedError()
@@ -29,6 +60,12 @@ class Variable(Generic[T], ABC):
     def __call__(self) -> T | None:
         return self.value()
 
+    def _try(self) -> T | None | _Missing:
+        try:
+            return self()
+        except VariableNotSet:
+            return _MISSING
+
     @overload
     def __get__(self, instance: None, owner: type[object]) -> T: ...
 
@@ -36,7 +73,19 @@ class Variable(Generic[T], ABC):
     def __get__(self, instance: object, owner: type[object]) -> T: ...
 
     def __get__(self, instance: object | None, owner: type[object]) -> T | None:
-        return self()
+        per_owner = _descriptor_cache.get(owner)
+        if per_owner is None:
+            per_owner = _descriptor_cache[owner] = {}
+        try:
+            cached = per_owner.get(self)
+        except TypeError:
+            # unhashable pipeline (e.g. a Const holding a list): evaluate uncached
+            return self()
+        if cached is not None and cached[0] == _cache_generation:
+            return cast(T, cached[1])
+        value = self()
+        per_owner[self] = (_cache_generation, value)
+        return value
 
     def __rshift__(self, hint: Hint[T]) -> Variable[T]:
         return hint.wrap(self)
@@ -48,52 +97,77 @@ class Variable(Generic[T], ABC):
         return wrapped
 
     def __or__(self, backup: Variable[T]) -> Variable[T]:
-        return _BackupWrapper(self, backup)
+        return _Or(_or_variants(self) + _or_variants(backup))
 
     def otherwise(self, *backups: Variable[T]) -> Variable[T]:
-        wrapped = self
+        variants = _or_variants(self)
         for backup in backups:
-            wrapped = _BackupWrapper(wrapped, backup)
-        return wrapped
+            variants += _or_variants(backup)
+        return _Or(variants)
 
     def __invert__(self) -> T:
         return cast(T, self)
 
     @classmethod
     def factory(cls, *args: Any, **kwargs: Any) -> Callable[[Any], Self]:
-        return wraps(cls)(partial(cls, *args, **kwargs))
+        key = (cls, args, tuple(sorted(kwargs.items())))
+        try:
+            cached = _factory_cache.get(key)
+        except TypeError:
+            # unhashable argument: build an uncached factory
+            return wraps(cls)(partial(cls, *args, **kwargs))
+        if cached is None:
+            cached = _factory_cache[key] = wraps(cls)(partial(cls, *args, **kwargs))
+        return cast(Callable[[Any], Self], cached)
 
 
 @dataclass(frozen=True)
-class _BackupWrapper(Variable[T]):
-    variable: Variable[T]
-    backup: Variable[T]
+class _Or(Variable[T]):
+    variants: tuple[Variable[T], ...]
+    _str: str = field(init=False, repr=False, compare=False)
+    _repr: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_str", repr(self.variants[-1]))
+        object.__setattr__(self, "_repr", "|".join(map(repr, self.variants)))
 
     def __str__(self) -> str:
-        return repr(self.backup)
+        return self._str
 
     def __repr__(self) -> str:
-        return f"{repr(self.variable)}|{self}"
+        return self._repr
 
     def value(self) -> T:
-        try:
-            return self.variable.value()
-        except VariableNotSet:
-            return self.backup.value()
+        not_set: VariableNotSet | None = None
+        for variant in self.variants:
+            try:
+                return variant.value()
+            except VariableNotSet as exc:
+                not_set = exc
+        assert not_set is not None
+        raise not_set
 
     def __call__(self) -> T | None:
-        try:
-            value = self.variable()
-        except VariableNotSet:
-            value = self.backup()
-            if value is None:
-                # VariableNotSet means that wrapped variable is required
-                raise  # even if backup is not
-            return value
-        return self.backup() if value is None else value
+        missing = False
+        for variant in self.variants:
+            value = variant._try()
+            if value is _MISSING:
+                # _MISSING means that the variant is required
+                missing = True
+            elif value is not None:
+                return cast(T, value)
+        if missing:
+            raise VariableNotSet(self._repr)
+        return None
+
+
+def _or_variants(variable: Variable[T]) -> tuple[Variable[T], ...]:
+    return variable.variants if isinstance(variable, _Or) else (variable,)
 
 
 class Hint(Generic[T], abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def wrap(self, variable: Variable[T]) -> Variable[T]:  # pragma: no cover
         raise NotImplementedError()
@@ -102,15 +176,27 @@ class Hint(Generic[T], abc.ABC):
 @dataclass(frozen=True)
 class Const(Variable[T]):
     val: T
+    _str: str = field(init=False, repr=False, compare=False)
+    _repr: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_str", f"Const({self.val})")
+        object.__setattr__(self, "_repr", f"Const[{type(self.val).__name__}]({self.val})")
 
     def value(self) -> T:
         return self.val
 
+    def __call__(self) -> T:
+        return self.val
+
+    def _try(self) -> T:
+        return self.val
+
     def __str__(self) -> str:
-        return f"Const({self.val})"
+        return self._str
 
     def __repr__(self) -> str:
-        return f"Const[{type(self.val).__name__}]({self.val})"
+        return self._repr
 
 
 @dataclass(frozen=True)
@@ -118,52 +204,83 @@ class List(Generic[T, P, S], Variable[list[T]]):
     src: Variable[S]
     splitter: Callable[[S], list[P]] = field(kw_only=True)
     parser: Callable[[P], T] = field(kw_only=True)
+    _str: str = field(init=False, repr=False, compare=False)
+    _repr: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_str", f"List({str(self.src)},{self.splitter.__name__},{self.parser.__name__})")
+        object.__setattr__(self, "_repr", f"List({repr(self.src)},{self.splitter.__name__},{self.parser.__name__})")
 
     def value(self) -> list[T]:
         try:
-            return list(map(self.parser, self.splitter(self.src.value())))
+            value = self.src.value()
         except StandbyError as exc:
             exc.args += (repr(self),)
-            raise exc
+            raise
+        return self._parse(value)
 
     def __call__(self) -> list[T] | None:
         try:
             value = self.src()
         except StandbyError as exc:
             exc.args += (repr(self),)
-            raise exc
-        return list(map(self.parser, self.splitter(value))) if value is not None else None
+            raise
+        return self._parse(value) if value is not None else None
+
+    def _parse(self, value: S) -> list[T]:
+        return list(map(self.parser, self.splitter(value)))
 
     def __str__(self) -> str:
-        return f"List({str(self.src)},{self.splitter.__name__},{self.parser.__name__})"
+        return self._str
 
     def __repr__(self) -> str:
-        return f"List({repr(self.src)},{self.splitter.__name__},{self.parser.__name__})"
+        return self._repr
 
 
 @dataclass(frozen=True)
 class Link(Generic[T, S], Variable[T]):
     src: Variable[S]
     linker: Callable[[S], Variable[T]] = field(kw_only=True)
+    _str: str = field(init=False, repr=False, compare=False)
+    _repr: str = field(init=False, repr=False, compare=False)
+    # last successful resolution as (generation, source value, target value)
+    _memo: tuple[int, S, T] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_str", f"Link({self.src},{self.linker.__name__})")
+        object.__setattr__(self, "_repr", f"Link({repr(self.src)},{self.linker.__name__})")
 
     def value(self) -> T:
         try:
-            return self.linker(self.src.value()).value()
+            src = self.src.value()
+            memo = self._memo
+            if memo is not None and memo[0] == _cache_generation and memo[1] == src:
+                return memo[2]
+            value = self.linker(src).value()
         except StandbyError as exc:
             exc.args += (repr(self),)
-            raise exc
+            raise
+        object.__setattr__(self, "_memo", (_cache_generation, src, value))
+        return value
 
     def __call__(self) -> T | None:
         try:
             if src := self.src():
-                return self.linker(src)()
-            return None
+                memo = self._memo
+                if memo is not None and memo[0] == _cache_generation and memo[1] == src:
+                    return memo[2]
+                value = self.linker(src)()
+            else:
+                return None
         except StandbyError as exc:
             exc.args += (repr(self),)
-            raise exc
+            raise
+        if value is not None:
+            object.__setattr__(self, "_memo", (_cache_generation, src, value))
+        return value
 
     def __str__(self) -> str:
-        return f"Link({self.src},{self.linker.__name__})"
+        return self._str
 
     def __repr__(self) -> str:
-        return f"Link({repr(self.src)},{self.linker.__name__})"
+        return self._repr
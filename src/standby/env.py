@@ -2,42 +2,90 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
-from typing import Callable, Generic, TypeVar
+from typing import Any, Callable, Generic, TypeVar, cast
 
-from .core import Link, List, Variable
+from .core import _MISSING, Link, List, Variable, _bump_cache_generation, _Missing
 from .exc import VariableNotSet
 
-__all__ = ["Var", "SeparatedList", "Ref"]
+__all__ = ["Var", "SeparatedList", "Ref", "reset_cache"]
 
 
 T = TypeVar("T")
 
+# Bound once at import: saves the os -> environ -> get lookup chain on every read
+_env_get = os.environ.get
+
+# Parsed values memoized per (name, parser) as (raw, parsed); comparing the
+# stored raw string against the current one keeps a changed env value from
+# ever serving a stale parsed result, without accumulating superseded entries.
+_ENV_CACHE: dict[tuple[str, Callable[[str], Any]], tuple[str, Any]] = {}
+
+
+def reset_cache() -> None:
+    _ENV_CACHE.clear()
+    _bump_cache_generation()
+
 
 @dataclass(frozen=True)
 class Var(Generic[T], Variable[T]):
     name: str
     parser: Callable[[str], T]
+    _repr: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_repr", f"env.Var({self.name},{self.parser.__name__})")
 
     def value(self) -> T:
-        try:
-            return self.parser(os.environ[self.name])
-        except KeyError:
+        value = self._try()
+        if value is _MISSING:
             raise VariableNotSet(self.name, repr(self))
+        return cast(T, value)
+
+    def _try(self) -> T | None | _Missing:
+        raw = _env_get(self.name)
+        if raw is None:
+            return _MISSING
+        key = (self.name, self.parser)
+        try:
+            cached = _ENV_CACHE.get(key)
+        except TypeError:
+            # unhashable parser: parse uncached
+            return self.parser(raw)
+        if cached is not None and cached[0] == raw:
+            return cast(T, cached[1])
+        parsed = self.parser(raw)
+        _ENV_CACHE[key] = (raw, parsed)
+        return parsed
 
     def __str__(self) -> str:
-        return f"env.Var({self.name},{self.parser.__name__})"
+        return self._repr
 
     def __repr__(self) -> str:
-        return f"env.Var({self.name},{self.parser.__name__})"
+        return self._repr
 
 
 def _splitter_factory(sep: str) -> Callable[[str], list[str]]:
-    def split_after_strip_if_not_empty(src: str) -> list[str]:
-        if src := src.strip():
-            return src.split(sep)
-        else:
+    # sep is bound as a default argument: a local load per call instead of a closure cell deref
+    if any(char.isspace() for char in sep):
+        # a whitespace separator interacts with the outer strip, so strip first
+        def split_after_strip_if_not_empty(src: str, _sep: str = sep) -> list[str]:
+            src = src.strip()
+            return src.split(_sep) if src else []
+
+    else:
+
+        def split_after_strip_if_not_empty(src: str, _sep: str = sep) -> list[str]:
+            # split first and strip only the edge tokens: skips copying the whole string
+            parts = src.split(_sep)
+            parts[0] = parts[0].lstrip()
+            parts[-1] = parts[-1].rstrip()
+            if parts[0] or len(parts) > 1:
+                return parts
             return []
 
+        # marks the splitter as a plain split on sep, enabling the numeric fast path
+        setattr(split_after_strip_if_not_empty, "_split_sep", sep)
+
     return split_after_strip_if_not_empty
 
 
@@ -45,12 +93,35 @@ def _splitter_factory(sep: str) -> Callable[[str], list[str]]:
 class SeparatedList(List[T, str, str]):
     split_sep: str = ","
     splitter: Callable[[str], list[str]] = _splitter_factory(split_sep)
+    _fast_sep: str | None = field(init=False, repr=False, compare=False)
+
+    def _parse(self, value: str) -> list[T]:
+        if self._fast_sep is not None:
+            # int/float strip surrounding whitespace themselves, so feed them raw tokens
+            if not value or value.isspace():
+                return []
+            return list(map(self.parser, value.split(self._fast_sep)))
+        return super()._parse(value)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_str",
+            f"env.SeparatedList({self.src},{self.splitter.__name__},{self.split_sep},{self.parser.__name__})",
+        )
+        object.__setattr__(
+            self,
+            "_repr",
+            f"env.SeparatedList({repr(self.src)},{self.splitter.__name__},{self.split_sep},{self.parser.__name__})",
+        )
+        fast_parser = self.parser is int or self.parser is float
+        object.__setattr__(self, "_fast_sep", getattr(self.splitter, "_split_sep", None) if fast_parser else None)
 
     def __str__(self) -> str:
-        return f"env.SeparatedList({self.src},{self.splitter.__name__},{self.split_sep},{self.parser.__name__})"
+        return self._str
 
     def __repr__(self) -> str:
-        return f"env.SeparatedList({repr(self.src)},{self.splitter.__name__},{self.split_sep},{self.parser.__name__})"
+        return self._repr
 
 
 @dataclass(frozen=True)
@@ -59,8 +130,14 @@ class Ref(Link[T, str]):
     parser: Callable[[str], T] = field(kw_only=True)
     linker: Callable[[str], Var[T]] = Var.factory(parser=parser)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_str", f"env.Ref({self.src},{self.linker.__name__},{self.parser.__name__})")
+        object.__setattr__(
+            self, "_repr", f"env.Ref({repr(self.src)},{self.linker.__name__},{self.parser.__name__})"
+        )
+
     def __str__(self) -> str:
-        return f"env.Ref({self.src},{self.linker.__name__},{self.parser.__name__})"
+        return self._str
 
     def __repr__(self) -> str:
-        return f"env.Ref({repr(self.src)},{self.linker.__name__},{self.parser.__name__})"
+        return self._repr
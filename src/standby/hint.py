@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, TypeVar
+from dataclasses import dataclass, field
+from typing import Callable, TypeVar, cast
 
-from .core import Hint, Variable
+from .core import Hint, Variable, _Missing
 from .exc import ValueNotValid, VariableNotSet
 
 __all__ = ["Default", "Required", "Validated"]
@@ -17,59 +17,30 @@ T = TypeVar("T")
 class Default(Hint[T]):
     value: T
 
-    def wrap(self, variable: Variable[T]) -> Variable[T]:
-        return self._Wrapper(variable, self.value)
-
-    @dataclass(frozen=True)
-    class _Wrapper(Variable[R]):
-        variable: Variable[R]
-        default: R
-
-        def value(self) -> R:
-            try:
-                return self.variable.value()
-            except VariableNotSet:
-                return self.default
-
-        def __str__(self) -> str:
-            return f"Default({self.default})"
+    def __str__(self) -> str:
+        return f"Default({self.value})"
 
-        def __repr__(self) -> str:
-            return f"{repr(self.variable)}>>{self}"
-
-        def __call__(self) -> R | None:
-            try:
-                value = self.variable()
-            except VariableNotSet:
-                return self.default
-            return self.default if value is None else value
+    def wrap(self, variable: Variable[T]) -> Variable[T]:
+        if isinstance(variable, _Hinted) and variable.hints[-1] == self:
+            # the same default applied twice in a row changes nothing
+            return variable
+        return _hinted(variable, self)
 
 
 @dataclass(frozen=True)
 class Required(Hint):
     is_required: bool = True
 
-    def wrap(self, variable: Variable[T]) -> Variable[T]:
-        return variable if self.is_required else self._Wrapper(variable)
-
-    @dataclass(frozen=True)
-    class _Wrapper(Variable[T]):
-        variable: Variable[T]
+    def __str__(self) -> str:
+        return f"Required({self.is_required})"
 
-        def __str__(self) -> str:
-            return f"Required({False})"
-
-        def __repr__(self) -> str:
-            return f"{repr(self.variable)}>>{self}"
-
-        def value(self) -> T:
-            return self.variable.value()
-
-        def __call__(self) -> T | None:
-            try:
-                return self.variable()
-            except VariableNotSet:
-                return None
+    def wrap(self, variable: Variable[T]) -> Variable[T]:
+        if self.is_required:
+            return variable
+        if isinstance(variable, _Hinted) and isinstance(variable.hints[-1], Required):
+            # a missing value is already absorbed by the previous Required(False)
+            return variable
+        return _hinted(variable, self)
 
 
 @dataclass(frozen=True)
@@ -77,35 +48,82 @@ class Validated(Hint[T]):
     validator: Callable[[T], bool]
     raises: bool = True
 
+    def __str__(self) -> str:
+        return f"Validated({self.validator.__name__},{'raises' if self.raises else 'returns None'} on invalid value)"
+
     def wrap(self, variable: Variable[T]) -> Variable[T]:
-        return self._Wrapper(variable, self.validator, self.raises)
-
-    @dataclass(frozen=True)
-    class _Wrapper(Variable[R]):
-        variable: Variable[R]
-        validator: Callable[[R], bool]
-        raises: bool = True
-
-        def __str__(self) -> str:
-            return (f"Validated({self.validator.__name__},"
-                    f"{'raises' if self.raises else 'returns None'} on invalid value)")
-
-        def __repr__(self) -> str:
-            return f"{repr(self.variable)}>>{self}"
-
-        def value(self) -> R:
-            if self.validator(value := self.variable.value()):
-                return value
-            else:
-                raise ValueNotValid(value)
-
-        def __call__(self) -> R | None:
-            value = self.variable()
-            if value is None:
-                return None
-            elif self.validator(value):
-                return value
-            elif self.raises:
-                raise ValueNotValid(value, repr(self))
-            else:
-                return None
+        return _hinted(variable, self)
+
+
+@dataclass(frozen=True)
+class _Hinted(Variable[R]):
+    variable: Variable[R]
+    hints: tuple[Hint[R], ...]
+    _str: str = field(init=False, repr=False, compare=False)
+    _repr: str = field(init=False, repr=False, compare=False)
+    _ctxs: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        chain = repr(self.variable)
+        ctxs = []
+        for hint in self.hints:
+            chain = f"{chain}>>{hint}"
+            ctxs.append(chain)
+        object.__setattr__(self, "_str", str(self.hints[-1]))
+        object.__setattr__(self, "_repr", chain)
+        object.__setattr__(self, "_ctxs", tuple(ctxs))
+
+    def __str__(self) -> str:
+        return self._str
+
+    def __repr__(self) -> str:
+        return self._repr
+
+    def value(self) -> R:
+        not_set: VariableNotSet | None = None
+        value: R | None = None
+        try:
+            value = self.variable.value()
+        except VariableNotSet as exc:
+            not_set = exc
+        for hint in self.hints:
+            if isinstance(hint, Default):
+                if not_set is not None:
+                    value, not_set = hint.value, None
+            elif isinstance(hint, Validated):
+                if not_set is None and not hint.validator(cast(R, value)):
+                    raise ValueNotValid(value)
+        if not_set is not None:
+            raise not_set
+        return cast(R, value)
+
+    def __call__(self) -> R | None:
+        value = self._try()
+        if isinstance(value, _Missing):
+            # missing survived every hint: re-raise from the source with its own args
+            return self.variable()
+        return value
+
+    def _try(self) -> R | None | _Missing:
+        value = self.variable._try()
+        for hint, ctx in zip(self.hints, self._ctxs):
+            if isinstance(hint, Default):
+                if isinstance(value, _Missing) or value is None:
+                    value = hint.value
+            elif isinstance(hint, Required):
+                if isinstance(value, _Missing):
+                    value = None
+            elif isinstance(hint, Validated):
+                if isinstance(value, _Missing) or value is None:
+                    continue
+                if not hint.validator(value):
+                    if hint.raises:
+                        raise ValueNotValid(value, ctx)
+                    value = None
+        return value
+
+
+def _hinted(variable: Variable[T], hint: Hint[T]) -> Variable[T]:
+    if isinstance(variable, _Hinted):
+        return _Hinted(variable.variable, variable.hints + (hint,))
+    return _Hinted(variable, (hint,))
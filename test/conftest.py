@@ -0,0 +1,9 @@
+import pytest
+
+from standby import env
+
+
+@pytest.fixture(autouse=True)
+def _reset_env_cache():
+    yield
+    env.reset_cache()
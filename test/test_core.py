@@ -43,6 +43,22 @@ def test_rshift_hints_required(monkeypatch: pytest.MonkeyPatch):
         (Var[int]("SBY_NOT_REQ", int) >> Required(False)).value()
 
 
+def test_rshift_hints_noop_dedupe():
+    # Re-applying an equal Default is dropped at composition time
+    v = Var[int]("SBY_DEDUPE", int) >> Default(7)
+    assert v >> Default(7) is v
+    # but a different default is kept
+    assert v >> Default(8) is not v
+    assert repr(v >> Default(8)) == "env.Var(SBY_DEDUPE,int)>>Default(7)>>Default(8)"
+
+    # Required(False) right after Required(False) is dropped
+    nr = Var[int]("SBY_DEDUPE", int) >> Required(False)
+    assert nr >> Required(False) is nr
+    # not adjacent: a Default in between keeps the second Required(False)
+    defaulted = nr >> Default(1)
+    assert defaulted >> Required(False) is not defaulted
+
+
 def test_rshift_hints_validated(monkeypatch: pytest.MonkeyPatch):
     # Validated: passes when truthy and validator ok
     val_ok = Const[int](9) >> Validated(lambda x: x > 5)
@@ -2,7 +2,7 @@
 import pytest
 
 from standby.core import Const
-from standby.env import Ref, SeparatedList, Var, _splitter_factory
+from standby.env import Ref, SeparatedList, Var, _splitter_factory, reset_cache
 from standby.exc import VariableNotSet
 
 
@@ -71,3 +71,19 @@ def test_ref_value_with_explicit_linker(monkeypatch: pytest.MonkeyPatch):
     assert e.value.args[0] == "SBY_MISSING_TARGET"
     assert "env.Var(SBY_MISSING_TARGET,int)" in e.value.args[1]
     assert "env.Link(" in e.value.args[2] or "env.Ref(" in e.value.args[2]
+
+
+def test_descriptor_cached_until_reset_cache(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SBY_CACHED", "1")
+
+    class Conf:
+        A = Var[int]("SBY_CACHED", int)
+
+    assert Conf.A == 1
+
+    # descriptor reads are memoized: an env change is not seen until reset
+    monkeypatch.setenv("SBY_CACHED", "2")
+    assert Conf.A == 1
+
+    reset_cache()
+    assert Conf.A == 2